@@ -1,32 +1,55 @@
 from fastapi import FastAPI, APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient
+from pymongo.errors import DuplicateKeyError, PyMongoError
 import os
+import asyncio
 import logging
 import re
+from functools import lru_cache
 from pathlib import Path
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import List, Optional, Dict
 import uuid
 from datetime import datetime
 from bson import ObjectId
+from bson.errors import InvalidId
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncMongoClient(mongo_url)
 db = client[os.environ['DB_NAME']]
 
-# Create the main app without a prefix
-app = FastAPI()
+# Create the main app without a prefix; responses are serialized with orjson
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
 
-# Phone number normalization function
+# Upper bound (and default) for the page size of list endpoints; pages are
+# ordered by _id so skip/limit paging is stable
+MAX_PAGE_SIZE = 1000
+
+# Upper bound for the number of phones in one bulk normalization request
+MAX_BULK_PHONES = 1000
+
+# Matches every non-digit character stripped during phone normalization
+_NONDIGIT_RE = re.compile(r'\D')
+# Numbers already in the normalized +7 9XX XXX XX XX format
+_NORMALIZED_RE = re.compile(r'\+7 9[0-9]{2} [0-9]{3} [0-9]{2} [0-9]{2}')
+# Deletion table for the ASCII non-digit characters (fast path for str.translate)
+_STRIP_NONDIGITS = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128) if not chr(c).isdigit()
+))
+
+# Phone number normalization function (pure, so results are memoized;
+# invalid input raises and is never cached)
+@lru_cache(maxsize=4096)
 def normalize_phone_number(phone: str) -> str:
     """
     Normalize Russian phone numbers to +7 999 888 77 66 format
@@ -37,32 +60,58 @@ def normalize_phone_number(phone: str) -> str:
     - +7 (965) 109-11-62
     - (965)1091162
     """
+    # Stored numbers come back already normalized; nothing to do
+    if _NORMALIZED_RE.fullmatch(phone):
+        return phone
+    
     # Remove all non-digit characters
-    digits = re.sub(r'\D', '', phone)
+    digits = phone.translate(_STRIP_NONDIGITS)
+    if not digits.isascii():
+        # Non-ASCII leftovers: let the Unicode-aware regex decide what a digit is
+        digits = _NONDIGIT_RE.sub('', phone)
     
-    # Handle different input formats
-    if digits.startswith('8') and len(digits) == 11:
-        # 89651091162 -> 9651091162
-        digits = digits[1:]
-    elif digits.startswith('7') and len(digits) == 11:
-        # 79651091162 -> 9651091162  
+    # Handle different input formats:
+    # 89651091162 / 79651091162 -> 9651091162
+    if len(digits) == 11 and digits[0] in '78':
         digits = digits[1:]
     
     # Should now have 10 digits starting with 9
-    if len(digits) != 10 or not digits.startswith('9'):
+    if len(digits) != 10 or digits[0] != '9':
         raise ValueError(f"Invalid Russian phone number format: {phone}")
     
     # Format as +7 999 888 77 66
-    return f"+7 {digits[:3]} {digits[3:6]} {digits[6:8]} {digits[8:10]}"
+    return "+7 %s %s %s %s" % (digits[:3], digits[3:6], digits[6:8], digits[8:])
+
+def parse_object_id(value: str, name: str) -> ObjectId:
+    """Parse a path/body ID once, turning malformed values into a 400"""
+    try:
+        return ObjectId(value)
+    except (InvalidId, TypeError):
+        raise HTTPException(status_code=400, detail=f"Invalid {name} ID")
+
+def document_to_json(doc: dict, timestamp_field: str = "created_at") -> dict:
+    """
+    Convert a stored MongoDB document into its API representation without
+    a Pydantic round-trip. Timestamps are not persisted on insert, so the
+    model default is applied here just like Model(**doc) would do.
+    """
+    doc["_id"] = str(doc["_id"])
+    if timestamp_field not in doc:
+        doc[timestamp_field] = datetime.utcnow()
+    return doc
 
 # Pydantic models
+# Shared config for models mapped to MongoDB documents (populated via the "_id" alias);
+# model instances passed to validation are reused as-is, never copied/revalidated
+DOCUMENT_MODEL_CONFIG = ConfigDict(populate_by_name=True, revalidate_instances='never')
+
 class Operator(BaseModel):
     id: Optional[str] = Field(default=None, alias="_id")
     name: str
     logo_base64: Optional[str] = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
-    model_config = {"populate_by_name": True}
+    model_config = DOCUMENT_MODEL_CONFIG
 
 class OperatorCreate(BaseModel):
     name: str
@@ -74,7 +123,7 @@ class Service(BaseModel):
     logo_base64: Optional[str] = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
-    model_config = {"populate_by_name": True}
+    model_config = DOCUMENT_MODEL_CONFIG
 
 class ServiceCreate(BaseModel):
     name: str
@@ -91,7 +140,7 @@ class Phone(BaseModel):
     def validate_number(cls, v):
         return normalize_phone_number(v)
 
-    model_config = {"populate_by_name": True}
+    model_config = DOCUMENT_MODEL_CONFIG
 
 class PhoneCreate(BaseModel):
     number: str
@@ -108,18 +157,15 @@ class Usage(BaseModel):
     service_id: str
     used_at: datetime = Field(default_factory=datetime.utcnow)
 
-    model_config = {"populate_by_name": True}
+    model_config = DOCUMENT_MODEL_CONFIG
 
 class UsageCreate(BaseModel):
     phone_id: str
     service_id: str
 
-# Search response models
-class SearchResult(BaseModel):
-    type: str  # "phone" or "service"
-    id: str
-    display_text: str
-    
+class PhoneBatch(BaseModel):
+    phones: List[str] = Field(max_length=MAX_BULK_PHONES)
+
 # API Endpoints
 
 @api_router.get("/")
@@ -135,55 +181,67 @@ async def normalize_phone_endpoint(phone: str):
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+# Bulk normalization: every entry gets its own ok/error status, so one
+# request can validate a mix of valid and invalid numbers
+@api_router.post("/normalize-phone/bulk")
+async def normalize_phone_bulk_endpoint(batch: PhoneBatch):
+    results = []
+    for phone in batch.phones:
+        try:
+            normalized = normalize_phone_number(phone)
+        except ValueError as e:
+            results.append({"original": phone, "ok": False, "normalized": None, "error": str(e)})
+        else:
+            results.append({"original": phone, "ok": True, "normalized": normalized, "error": None})
+    return results
+
 # Operator endpoints
 @api_router.post("/operators", response_model=Operator)
 async def create_operator(operator: OperatorCreate):
     operator_dict = operator.model_dump()
     result = await db.operators.insert_one(operator_dict)
-    created_operator = await db.operators.find_one({"_id": result.inserted_id})
-    created_operator["_id"] = str(created_operator["_id"])
-    return Operator(**created_operator)
-
-@api_router.get("/operators", response_model=List[Operator])
-async def get_operators():
-    operators = await db.operators.find().to_list(1000)
-    for op in operators:
-        op["_id"] = str(op["_id"])
-    return [Operator(**op) for op in operators]
-
-@api_router.get("/operators/{operator_id}", response_model=Operator)
+    operator_dict["_id"] = str(result.inserted_id)
+    return Operator.model_construct(**operator_dict)
+
+@api_router.get("/operators")
+async def get_operators(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    include_logos: bool = True,
+):
+    # Logos are the bulk of each document; pickers and stats can skip them
+    projection = None if include_logos else {"logo_base64": 0}
+    operators = await db.operators.find({}, projection).sort("_id", 1).skip(skip).limit(limit).to_list(None)
+    return ORJSONResponse([document_to_json(op) for op in operators])
+
+@api_router.get("/operators/{operator_id}")
 async def get_operator(operator_id: str):
-    if not ObjectId.is_valid(operator_id):
-        raise HTTPException(status_code=400, detail="Invalid operator ID")
-    operator = await db.operators.find_one({"_id": ObjectId(operator_id)})
+    operator_oid = parse_object_id(operator_id, "operator")
+    operator = await db.operators.find_one({"_id": operator_oid})
     if not operator:
         raise HTTPException(status_code=404, detail="Operator not found")
-    operator["_id"] = str(operator["_id"])
-    return Operator(**operator)
+    return ORJSONResponse(document_to_json(operator))
 
 @api_router.put("/operators/{operator_id}", response_model=Operator)
 async def update_operator(operator_id: str, operator: OperatorCreate):
-    if not ObjectId.is_valid(operator_id):
-        raise HTTPException(status_code=400, detail="Invalid operator ID")
+    operator_oid = parse_object_id(operator_id, "operator")
     
     update_data = operator.model_dump()
     result = await db.operators.update_one(
-        {"_id": ObjectId(operator_id)}, 
+        {"_id": operator_oid}, 
         {"$set": update_data}
     )
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Operator not found")
     
-    updated_operator = await db.operators.find_one({"_id": ObjectId(operator_id)})
-    updated_operator["_id"] = str(updated_operator["_id"])
-    return Operator(**updated_operator)
+    update_data["_id"] = operator_id
+    return Operator.model_construct(**update_data)
 
 @api_router.delete("/operators/{operator_id}")
 async def delete_operator(operator_id: str):
-    if not ObjectId.is_valid(operator_id):
-        raise HTTPException(status_code=400, detail="Invalid operator ID")
+    operator_oid = parse_object_id(operator_id, "operator")
     
-    result = await db.operators.delete_one({"_id": ObjectId(operator_id)})
+    result = await db.operators.delete_one({"_id": operator_oid})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Operator not found")
     
@@ -194,50 +252,48 @@ async def delete_operator(operator_id: str):
 async def create_service(service: ServiceCreate):
     service_dict = service.model_dump()
     result = await db.services.insert_one(service_dict)
-    created_service = await db.services.find_one({"_id": result.inserted_id})
-    created_service["_id"] = str(created_service["_id"])
-    return Service(**created_service)
-
-@api_router.get("/services", response_model=List[Service])
-async def get_services():
-    services = await db.services.find().to_list(1000)
-    for svc in services:
-        svc["_id"] = str(svc["_id"])
-    return [Service(**svc) for svc in services]
-
-@api_router.get("/services/{service_id}", response_model=Service)
+    service_dict["_id"] = str(result.inserted_id)
+    return Service.model_construct(**service_dict)
+
+@api_router.get("/services")
+async def get_services(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    include_logos: bool = True,
+):
+    # Logos are the bulk of each document; pickers and stats can skip them
+    projection = None if include_logos else {"logo_base64": 0}
+    services = await db.services.find({}, projection).sort("_id", 1).skip(skip).limit(limit).to_list(None)
+    return ORJSONResponse([document_to_json(svc) for svc in services])
+
+@api_router.get("/services/{service_id}")
 async def get_service(service_id: str):
-    if not ObjectId.is_valid(service_id):
-        raise HTTPException(status_code=400, detail="Invalid service ID")
-    service = await db.services.find_one({"_id": ObjectId(service_id)})
+    service_oid = parse_object_id(service_id, "service")
+    service = await db.services.find_one({"_id": service_oid})
     if not service:
         raise HTTPException(status_code=404, detail="Service not found")
-    service["_id"] = str(service["_id"])
-    return Service(**service)
+    return ORJSONResponse(document_to_json(service))
 
 @api_router.put("/services/{service_id}", response_model=Service)
 async def update_service(service_id: str, service: ServiceCreate):
-    if not ObjectId.is_valid(service_id):
-        raise HTTPException(status_code=400, detail="Invalid service ID")
+    service_oid = parse_object_id(service_id, "service")
     
     update_data = service.model_dump()
     result = await db.services.update_one(
-        {"_id": ObjectId(service_id)}, 
+        {"_id": service_oid}, 
         {"$set": update_data}
     )
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Service not found")
     
-    updated_service = await db.services.find_one({"_id": ObjectId(service_id)})
-    updated_service["_id"] = str(updated_service["_id"])
-    return Service(**updated_service)
+    update_data["_id"] = service_id
+    return Service.model_construct(**update_data)
 
 @api_router.delete("/services/{service_id}")
 async def delete_service(service_id: str):
-    if not ObjectId.is_valid(service_id):
-        raise HTTPException(status_code=400, detail="Invalid service ID")
+    service_oid = parse_object_id(service_id, "service")
     
-    result = await db.services.delete_one({"_id": ObjectId(service_id)})
+    result = await db.services.delete_one({"_id": service_oid})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Service not found")
     
@@ -247,72 +303,67 @@ async def delete_service(service_id: str):
 @api_router.post("/phones", response_model=Phone)
 async def create_phone(phone: PhoneCreate):
     # Check if operator exists
-    if not ObjectId.is_valid(phone.operator_id):
-        raise HTTPException(status_code=400, detail="Invalid operator ID")
+    operator_oid = parse_object_id(phone.operator_id, "operator")
     
-    operator = await db.operators.find_one({"_id": ObjectId(phone.operator_id)})
+    operator = await db.operators.find_one({"_id": operator_oid}, {"_id": 1})
     if not operator:
         raise HTTPException(status_code=404, detail="Operator not found")
     
-    # Check if phone already exists
-    existing_phone = await db.phones.find_one({"number": phone.number})
-    if existing_phone:
-        raise HTTPException(status_code=409, detail="Phone number already exists")
-    
+    # Duplicate numbers are rejected by the unique index on phones.number
     phone_dict = phone.model_dump()
-    result = await db.phones.insert_one(phone_dict)
-    created_phone = await db.phones.find_one({"_id": result.inserted_id})
-    created_phone["_id"] = str(created_phone["_id"])
-    return Phone(**created_phone)
-
-@api_router.get("/phones", response_model=List[Phone])
-async def get_phones():
-    phones = await db.phones.find().to_list(1000)
-    for phone in phones:
-        phone["_id"] = str(phone["_id"])
-    return [Phone(**phone) for phone in phones]
-
-@api_router.get("/phones/{phone_id}", response_model=Phone)
+    try:
+        result = await db.phones.insert_one(phone_dict)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=409, detail="Phone number already exists")
+    phone_dict["_id"] = str(result.inserted_id)
+    return Phone.model_construct(**phone_dict)
+
+@api_router.get("/phones")
+async def get_phones(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+):
+    phones = await db.phones.find().sort("_id", 1).skip(skip).limit(limit).to_list(None)
+    return ORJSONResponse([document_to_json(phone) for phone in phones])
+
+@api_router.get("/phones/{phone_id}")
 async def get_phone(phone_id: str):
-    if not ObjectId.is_valid(phone_id):
-        raise HTTPException(status_code=400, detail="Invalid phone ID")
-    phone = await db.phones.find_one({"_id": ObjectId(phone_id)})
+    phone_oid = parse_object_id(phone_id, "phone")
+    phone = await db.phones.find_one({"_id": phone_oid})
     if not phone:
         raise HTTPException(status_code=404, detail="Phone not found")
-    phone["_id"] = str(phone["_id"])
-    return Phone(**phone)
+    return ORJSONResponse(document_to_json(phone))
 
 @api_router.put("/phones/{phone_id}", response_model=Phone)
 async def update_phone(phone_id: str, phone: PhoneCreate):
-    if not ObjectId.is_valid(phone_id):
-        raise HTTPException(status_code=400, detail="Invalid phone ID")
+    phone_oid = parse_object_id(phone_id, "phone")
     
     # Check if operator exists
-    if not ObjectId.is_valid(phone.operator_id):
-        raise HTTPException(status_code=400, detail="Invalid operator ID")
+    operator_oid = parse_object_id(phone.operator_id, "operator")
     
-    operator = await db.operators.find_one({"_id": ObjectId(phone.operator_id)})
+    operator = await db.operators.find_one({"_id": operator_oid}, {"_id": 1})
     if not operator:
         raise HTTPException(status_code=404, detail="Operator not found")
     
     update_data = phone.model_dump()
-    result = await db.phones.update_one(
-        {"_id": ObjectId(phone_id)}, 
-        {"$set": update_data}
-    )
+    try:
+        result = await db.phones.update_one(
+            {"_id": phone_oid}, 
+            {"$set": update_data}
+        )
+    except DuplicateKeyError:
+        raise HTTPException(status_code=409, detail="Phone number already exists")
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Phone not found")
     
-    updated_phone = await db.phones.find_one({"_id": ObjectId(phone_id)})
-    updated_phone["_id"] = str(updated_phone["_id"])
-    return Phone(**updated_phone)
+    update_data["_id"] = phone_id
+    return Phone.model_construct(**update_data)
 
 @api_router.delete("/phones/{phone_id}")
 async def delete_phone(phone_id: str):
-    if not ObjectId.is_valid(phone_id):
-        raise HTTPException(status_code=400, detail="Invalid phone ID")
+    phone_oid = parse_object_id(phone_id, "phone")
     
-    result = await db.phones.delete_one({"_id": ObjectId(phone_id)})
+    result = await db.phones.delete_one({"_id": phone_oid})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Phone not found")
     
@@ -322,90 +373,92 @@ async def delete_phone(phone_id: str):
 @api_router.post("/usage", response_model=Usage)
 async def create_usage(usage: UsageCreate):
     # Validate phone and service exist
-    if not ObjectId.is_valid(usage.phone_id):
-        raise HTTPException(status_code=400, detail="Invalid phone ID")
-    if not ObjectId.is_valid(usage.service_id):
-        raise HTTPException(status_code=400, detail="Invalid service ID")
+    phone_oid = parse_object_id(usage.phone_id, "phone")
+    service_oid = parse_object_id(usage.service_id, "service")
     
-    phone = await db.phones.find_one({"_id": ObjectId(usage.phone_id)})
-    service = await db.services.find_one({"_id": ObjectId(usage.service_id)})
+    # Run both existence checks in a single round-trip window
+    phone, service = await asyncio.gather(
+        db.phones.find_one({"_id": phone_oid}, {"_id": 1}),
+        db.services.find_one({"_id": service_oid}, {"_id": 1}),
+    )
     
     if not phone:
         raise HTTPException(status_code=404, detail="Phone not found")
     if not service:
         raise HTTPException(status_code=404, detail="Service not found")
     
-    # Check if usage already exists
-    existing_usage = await db.usage.find_one({
-        "phone_id": usage.phone_id,
-        "service_id": usage.service_id
-    })
-    if existing_usage:
-        raise HTTPException(status_code=409, detail="Usage already recorded")
-    
+    # Repeated usage is rejected by the unique (phone_id, service_id) index
     usage_dict = usage.model_dump()
-    result = await db.usage.insert_one(usage_dict)
-    created_usage = await db.usage.find_one({"_id": result.inserted_id})
-    created_usage["_id"] = str(created_usage["_id"])
-    return Usage(**created_usage)
-
-@api_router.get("/usage", response_model=List[Usage])
-async def get_usage():
-    usage_records = await db.usage.find().to_list(1000)
-    for usage in usage_records:
-        usage["_id"] = str(usage["_id"])
-    return [Usage(**usage) for usage in usage_records]
+    try:
+        result = await db.usage.insert_one(usage_dict)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=409, detail="Usage already recorded")
+    usage_dict["_id"] = str(result.inserted_id)
+    return Usage.model_construct(**usage_dict)
+
+@api_router.get("/usage")
+async def get_usage(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+):
+    usage_records = await db.usage.find().sort("_id", 1).skip(skip).limit(limit).to_list(None)
+    return ORJSONResponse([document_to_json(usage, "used_at") for usage in usage_records])
 
 @api_router.delete("/usage/{usage_id}")
 async def delete_usage(usage_id: str):
-    if not ObjectId.is_valid(usage_id):
-        raise HTTPException(status_code=400, detail="Invalid usage ID")
+    usage_oid = parse_object_id(usage_id, "usage")
     
-    result = await db.usage.delete_one({"_id": ObjectId(usage_id)})
+    result = await db.usage.delete_one({"_id": usage_oid})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Usage record not found")
     
     return {"message": "Usage record deleted successfully"}
 
 # Search endpoint
-@api_router.get("/search", response_model=List[SearchResult])
+@api_router.get("/search")
 async def search(q: str = Query(..., min_length=1)):
-    results = []
-    
     # Escape special regex characters in the query
     escaped_q = re.escape(q)
     
     # Search phones by normalized number
     try:
         normalized_query = normalize_phone_number(q)
-        escaped_normalized = re.escape(normalized_query)
-        phones = await db.phones.find({"number": {"$regex": escaped_normalized, "$options": "i"}}).to_list(10)
-        for phone in phones:
-            results.append(SearchResult(
-                type="phone",
-                id=str(phone["_id"]),
-                display_text=phone["number"]
-            ))
+        # A full number is stored verbatim, so this is a unique index hit
+        phone_filter = {"number": normalized_query}
     except ValueError:
         # Not a valid phone number, search phones by partial match
-        phones = await db.phones.find({"number": {"$regex": escaped_q, "$options": "i"}}).to_list(10)
-        for phone in phones:
-            results.append(SearchResult(
-                type="phone", 
-                id=str(phone["_id"]),
-                display_text=phone["number"]
-            ))
-    
-    # Search services by name
-    services = await db.services.find({"name": {"$regex": escaped_q, "$options": "i"}}).to_list(10)
-    for service in services:
-        results.append(SearchResult(
-            type="service",
-            id=str(service["_id"]),
-            display_text=service["name"]
-        ))
+        # Numbers contain no letters, so a case-sensitive match is equivalent
+        phone_filter = {"number": {"$regex": escaped_q}}
     
-    return results
+    # Phones and services (by name) are fetched in a single aggregation:
+    # $unionWith appends the service matches after the phone matches, and
+    # both branches are projected straight into the {type, id, display_text}
+    # search result shape
+    pipeline = [
+        {"$match": phone_filter},
+        {"$limit": 10},
+        {"$project": {
+            "_id": 0,
+            "type": {"$literal": "phone"},
+            "id": {"$toString": "$_id"},
+            "display_text": "$number",
+        }},
+        {"$unionWith": {
+            "coll": "services",
+            "pipeline": [
+                {"$match": {"name": {"$regex": escaped_q, "$options": "i"}}},
+                {"$limit": 10},
+                {"$project": {
+                    "_id": 0,
+                    "type": {"$literal": "service"},
+                    "id": {"$toString": "$_id"},
+                    "display_text": "$name",
+                }},
+            ],
+        }},
+    ]
+    cursor = await db.phones.aggregate(pipeline)
+    return ORJSONResponse(await cursor.to_list(None))
 
 # Include the router in the main app
 app.include_router(api_router)
@@ -425,6 +478,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+async def ensure_index(collection, keys, **kwargs):
+    # The unique indexes are the only duplicate guard, so refuse to boot without
+    # them: E11000 means existing duplicates must be removed first
+    try:
+        await collection.create_index(keys, **kwargs)
+    except PyMongoError as e:
+        logger.error(f"Could not build index {keys!r} on {collection.name}: {e}")
+        raise
+
+# Unique indexes back the duplicate checks in create_phone/update_phone/create_usage;
+# the rest support service name search and usage lookups by service
+@app.on_event("startup")
+async def create_indexes():
+    await asyncio.gather(
+        ensure_index(db.phones, "number", unique=True),
+        # Also serves phone_id-only lookups as the index prefix
+        ensure_index(db.usage, [("phone_id", 1), ("service_id", 1)], unique=True),
+        ensure_index(db.usage, "service_id"),
+        ensure_index(db.services, "name"),
+    )
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
-    client.close()
\ No newline at end of file
+    await client.close()
\ No newline at end of file
@@ -4,20 +4,41 @@ Comprehensive Backend API Tests for UPN (Russian Phone Number Tracker)
 Tests phone normalization, CRUD operations, usage tracking, and search functionality.
 """
 
-import requests
+import asyncio
+import httpx
+import orjson
 import json
 import base64
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import sys
 import os
 
 # Get backend URL from environment
 BACKEND_URL = "https://bonus-checker.preview.emergentagent.com/api"
 
+# Sample base64 logo (1x1 PNG) shared by all test payloads
+SAMPLE_LOGO_B64 = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8/5+hHgAHggJ/PchI7wAAAABJRU5ErkJggg=="
+
+# Request bodies reused across test runs
+OPERATOR_BODY = {"name": "МТС", "logo_base64": SAMPLE_LOGO_B64}
+OPERATOR_UPDATE_BODY = {"name": "МТС Обновленный", "logo_base64": SAMPLE_LOGO_B64}
+SERVICE_BODY = {"name": "Яндекс.Такси", "logo_base64": SAMPLE_LOGO_B64}
+SERVICE_UPDATE_BODY = {"name": "Яндекс.Такси Премиум", "logo_base64": SAMPLE_LOGO_B64}
+
 class UPNAPITester:
     def __init__(self):
         self.base_url = BACKEND_URL
-        self.session = requests.Session()
+        # One pooled HTTP/2 client shared by every test; independent requests
+        # are issued concurrently and multiplexed over the same connection
+        # (idle keep-alive connections never expire during a run)
+        limits = httpx.Limits(max_connections=50, max_keepalive_connections=50, keepalive_expiry=None)
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=10.0,
+            transport=httpx.AsyncHTTPTransport(http2=True, limits=limits, retries=3)
+        )
+        # Caps the number of in-flight requests of a concurrent batch
+        self.semaphore = asyncio.Semaphore(20)
         self.created_ids = {
             'operators': [],
             'services': [],
@@ -29,13 +50,18 @@ class UPNAPITester:
         """Log test messages with level"""
         print(f"[{level}] {message}")
         
-    def test_connection(self) -> bool:
+    async def test_connection(self) -> bool:
         """Test basic API connection"""
         try:
-            response = self.session.get(f"{self.base_url}/")
+            response = await self.client.get("/")
             if response.status_code == 200:
                 self.log("✅ API connection successful")
-                self.log(f"Response: {response.json()}")
+                self.log(f"Response: {orjson.loads(response.content)}")
+                # Concurrent batches only multiplex over one connection on HTTP/2
+                if response.http_version == "HTTP/2":
+                    self.log("✅ Negotiated HTTP/2, requests will be multiplexed")
+                else:
+                    self.log(f"⚠️  Server negotiated {response.http_version}, concurrent requests will use separate connections", "WARNING")
                 return True
             else:
                 self.log(f"❌ API connection failed: {response.status_code}", "ERROR")
@@ -44,7 +70,40 @@ class UPNAPITester:
             self.log(f"❌ API connection error: {str(e)}", "ERROR")
             return False
     
-    def test_phone_normalization(self) -> bool:
+    async def _req(self, method: str, path: str, expect: int = 200, read_body: bool = True, **kwargs) -> Tuple[bool, Any]:
+        """
+        Send one request through the pooled client (bounded by the semaphore)
+        and check it against the expected status code.
+        Returns (ok, body): on success body is the orjson-decoded response
+        (None when read_body=False, which skips downloading it on HTTP/2);
+        on failure body describes what went wrong.
+        """
+        try:
+            async with self.semaphore:
+                if read_body:
+                    response = await self.client.request(method, path, **kwargs)
+                else:
+                    async with self.client.stream(method, path, **kwargs) as response:
+                        # Closing an unread HTTP/1.1 response drops the pooled
+                        # connection; only an HTTP/2 stream can be reset cheaply
+                        if response.http_version != "HTTP/2":
+                            await response.aread()
+            
+            if response.status_code != expect:
+                detail = f" - {response.text}" if response.is_stream_consumed else ""
+                return False, f"{response.status_code}{detail}"
+            
+            return True, orjson.loads(response.content) if read_body and response.content else None
+        except Exception as e:
+            return False, f"{type(e).__name__}: {str(e)}"
+    
+    async def _warm_up(self):
+        """Touch the API root so the next suite starts on a live pooled connection"""
+        ok, error = await self._req("GET", "/")
+        if not ok:
+            self.log(f"⚠️  Warm-up request failed: {error}", "WARNING")
+    
+    async def test_phone_normalization(self) -> bool:
         """Test phone number normalization with various Russian formats"""
         self.log("\n=== Testing Phone Number Normalization ===")
         
@@ -58,244 +117,129 @@ class UPNAPITester:
             ("+7-965-109-11-62", "+7 965 109 11 62"),
             ("8 965 109 11 62", "+7 965 109 11 62")
         ]
+        invalid_cases = ["123", "abc", "+1234567890", ""]
         
         all_passed = True
         
-        for input_phone, expected in test_cases:
-            try:
-                # Test normalization endpoint
-                response = self.session.post(
-                    f"{self.base_url}/normalize-phone",
-                    params={"phone": input_phone}
-                )
+        # Valid and invalid cases each take one bulk request (the endpoint
+        # reports a per-entry status); one single-endpoint call keeps the
+        # 400 path covered
+        (valid_ok, results), (invalid_ok, invalid_results), (single_ok, single_error) = await asyncio.gather(
+            self._req("POST", "/normalize-phone/bulk", json={"phones": [p for p, _ in test_cases]}),
+            self._req("POST", "/normalize-phone/bulk", json={"phones": invalid_cases}),
+            self._req("POST", "/normalize-phone", expect=400, read_body=False, params={"phone": invalid_cases[0]})
+        )
+        
+        if valid_ok:
+            if len(results) != len(test_cases):
+                self.log(f"❌ Bulk normalization returned {len(results)} results for {len(test_cases)} phones", "ERROR")
+                all_passed = False
+            
+            for (input_phone, expected), result in zip(test_cases, results):
+                normalized = result.get("normalized")
                 
-                if response.status_code == 200:
-                    result = response.json()
-                    normalized = result.get("normalized")
-                    
-                    if normalized == expected:
-                        self.log(f"✅ {input_phone} -> {normalized}")
-                    else:
-                        self.log(f"❌ {input_phone} -> {normalized} (expected: {expected})", "ERROR")
-                        all_passed = False
+                if normalized == expected:
+                    self.log(f"✅ {input_phone} -> {normalized}")
                 else:
-                    self.log(f"❌ Failed to normalize {input_phone}: {response.status_code}", "ERROR")
+                    self.log(f"❌ {input_phone} -> {normalized} (expected: {expected})", "ERROR")
                     all_passed = False
-                    
-            except Exception as e:
-                self.log(f"❌ Error normalizing {input_phone}: {str(e)}", "ERROR")
-                all_passed = False
+        else:
+            self.log(f"❌ Failed to bulk normalize phones: {results}", "ERROR")
+            all_passed = False
         
         # Test invalid phone numbers
-        invalid_cases = ["123", "abc", "+1234567890", ""]
-        
-        for invalid_phone in invalid_cases:
-            try:
-                response = self.session.post(
-                    f"{self.base_url}/normalize-phone",
-                    params={"phone": invalid_phone}
-                )
-                
-                if response.status_code == 400:
-                    self.log(f"✅ Correctly rejected invalid phone: {invalid_phone}")
+        if invalid_ok:
+            for invalid_phone, result in zip(invalid_cases, invalid_results):
+                if not result["ok"]:
+                    self.log(f"✅ Correctly rejected invalid phone: {invalid_phone} ({result['error']})")
                 else:
-                    self.log(f"❌ Should have rejected invalid phone {invalid_phone}: {response.status_code}", "ERROR")
+                    self.log(f"❌ Should have rejected invalid phone {invalid_phone}: {result['normalized']}", "ERROR")
                     all_passed = False
-                    
-            except Exception as e:
-                self.log(f"❌ Error testing invalid phone {invalid_phone}: {str(e)}", "ERROR")
-                all_passed = False
+        else:
+            self.log(f"❌ Failed to bulk validate invalid phones: {invalid_results}", "ERROR")
+            all_passed = False
+        
+        if single_ok:
+            self.log(f"✅ Single endpoint correctly rejected invalid phone: {invalid_cases[0]}")
+        else:
+            self.log(f"❌ Single endpoint should have rejected {invalid_cases[0]}: {single_error}", "ERROR")
+            all_passed = False
         
         return all_passed
     
-    def test_operators_crud(self) -> bool:
+    async def test_operators_crud(self) -> bool:
         """Test CRUD operations for operators"""
         self.log("\n=== Testing Operators CRUD ===")
         
         all_passed = True
         
-        # Create sample base64 logo (small PNG)
-        sample_logo = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8/5+hHgAHggJ/PchI7wAAAABJRU5ErkJggg=="
-        
         # Test CREATE operator
-        try:
-            operator_data = {
-                "name": "МТС",
-                "logo_base64": sample_logo
-            }
-            
-            response = self.session.post(
-                f"{self.base_url}/operators",
-                json=operator_data
-            )
-            
-            if response.status_code == 200:
-                operator = response.json()
-                operator_id = operator["_id"]  # Use _id instead of id
-                self.created_ids['operators'].append(operator_id)
-                self.log(f"✅ Created operator: {operator['name']} (ID: {operator_id})")
-            else:
-                self.log(f"❌ Failed to create operator: {response.status_code} - {response.text}", "ERROR")
-                all_passed = False
-                return all_passed
-                
-        except Exception as e:
-            self.log(f"❌ Error creating operator: {str(e)}", "ERROR")
-            all_passed = False
-            return all_passed
+        ok, operator = await self._req("POST", "/operators", json=OPERATOR_BODY)
+        if not ok:
+            self.log(f"❌ Failed to create operator: {operator}", "ERROR")
+            return False
         
-        # Test GET all operators
-        try:
-            response = self.session.get(f"{self.base_url}/operators")
-            
-            if response.status_code == 200:
-                operators = response.json()
-                self.log(f"✅ Retrieved {len(operators)} operators")
-                
-                if len(operators) > 0 and operators[0]["name"] == "МТС":
-                    self.log("✅ Operator data matches")
-                else:
-                    self.log("❌ Operator data mismatch", "ERROR")
-                    all_passed = False
-            else:
-                self.log(f"❌ Failed to get operators: {response.status_code}", "ERROR")
-                all_passed = False
-                
-        except Exception as e:
-            self.log(f"❌ Error getting operators: {str(e)}", "ERROR")
-            all_passed = False
+        operator_id = operator["_id"]  # Use _id instead of id
+        self.created_ids['operators'].append(operator_id)
+        self.log(f"✅ Created operator: {operator['name']} (ID: {operator_id})")
         
-        # Test GET single operator
-        try:
-            response = self.session.get(f"{self.base_url}/operators/{operator_id}")
-            
-            if response.status_code == 200:
-                operator = response.json()
-                self.log(f"✅ Retrieved single operator: {operator['name']}")
-            else:
-                self.log(f"❌ Failed to get single operator: {response.status_code}", "ERROR")
-                all_passed = False
-                
-        except Exception as e:
-            self.log(f"❌ Error getting single operator: {str(e)}", "ERROR")
+        # The POST body is the stored document; no need to read it back
+        if operator["name"] == OPERATOR_BODY["name"] and operator["logo_base64"] == SAMPLE_LOGO_B64:
+            self.log("✅ Operator data matches")
+        else:
+            self.log("❌ Operator data mismatch", "ERROR")
             all_passed = False
         
         # Test UPDATE operator
-        try:
-            update_data = {
-                "name": "МТС Обновленный",
-                "logo_base64": sample_logo
-            }
-            
-            response = self.session.put(
-                f"{self.base_url}/operators/{operator_id}",
-                json=update_data
-            )
-            
-            if response.status_code == 200:
-                updated_operator = response.json()
-                if updated_operator["name"] == "МТС Обновленный":
-                    self.log("✅ Updated operator successfully")
-                else:
-                    self.log("❌ Operator update data mismatch", "ERROR")
-                    all_passed = False
-            else:
-                self.log(f"❌ Failed to update operator: {response.status_code}", "ERROR")
-                all_passed = False
-                
-        except Exception as e:
-            self.log(f"❌ Error updating operator: {str(e)}", "ERROR")
+        ok, updated_operator = await self._req("PUT", f"/operators/{operator_id}", json=OPERATOR_UPDATE_BODY)
+        if not ok:
+            self.log(f"❌ Failed to update operator: {updated_operator}", "ERROR")
+            all_passed = False
+        elif updated_operator["name"] == OPERATOR_UPDATE_BODY["name"]:
+            self.log("✅ Updated operator successfully")
+        else:
+            self.log("❌ Operator update data mismatch", "ERROR")
             all_passed = False
         
         return all_passed
     
-    def test_services_crud(self) -> bool:
+    async def test_services_crud(self) -> bool:
         """Test CRUD operations for services"""
         self.log("\n=== Testing Services CRUD ===")
         
         all_passed = True
         
-        # Create sample base64 logo
-        sample_logo = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8/5+hHgAHggJ/PchI7wAAAABJRU5ErkJggg=="
-        
         # Test CREATE service
-        try:
-            service_data = {
-                "name": "Яндекс.Такси",
-                "logo_base64": sample_logo
-            }
-            
-            response = self.session.post(
-                f"{self.base_url}/services",
-                json=service_data
-            )
-            
-            if response.status_code == 200:
-                service = response.json()
-                service_id = service["_id"]  # Use _id instead of id
-                self.created_ids['services'].append(service_id)
-                self.log(f"✅ Created service: {service['name']} (ID: {service_id})")
-            else:
-                self.log(f"❌ Failed to create service: {response.status_code} - {response.text}", "ERROR")
-                all_passed = False
-                return all_passed
-                
-        except Exception as e:
-            self.log(f"❌ Error creating service: {str(e)}", "ERROR")
-            all_passed = False
-            return all_passed
+        ok, service = await self._req("POST", "/services", json=SERVICE_BODY)
+        if not ok:
+            self.log(f"❌ Failed to create service: {service}", "ERROR")
+            return False
         
-        # Test GET all services
-        try:
-            response = self.session.get(f"{self.base_url}/services")
-            
-            if response.status_code == 200:
-                services = response.json()
-                self.log(f"✅ Retrieved {len(services)} services")
-                
-                if len(services) > 0 and services[0]["name"] == "Яндекс.Такси":
-                    self.log("✅ Service data matches")
-                else:
-                    self.log("❌ Service data mismatch", "ERROR")
-                    all_passed = False
-            else:
-                self.log(f"❌ Failed to get services: {response.status_code}", "ERROR")
-                all_passed = False
-                
-        except Exception as e:
-            self.log(f"❌ Error getting services: {str(e)}", "ERROR")
+        service_id = service["_id"]  # Use _id instead of id
+        self.created_ids['services'].append(service_id)
+        self.log(f"✅ Created service: {service['name']} (ID: {service_id})")
+        
+        # The POST body is the stored document; no need to read it back
+        if service["name"] == SERVICE_BODY["name"] and service["logo_base64"] == SAMPLE_LOGO_B64:
+            self.log("✅ Service data matches")
+        else:
+            self.log("❌ Service data mismatch", "ERROR")
             all_passed = False
         
         # Test UPDATE service
-        try:
-            update_data = {
-                "name": "Яндекс.Такси Премиум",
-                "logo_base64": sample_logo
-            }
-            
-            response = self.session.put(
-                f"{self.base_url}/services/{service_id}",
-                json=update_data
-            )
-            
-            if response.status_code == 200:
-                updated_service = response.json()
-                if updated_service["name"] == "Яндекс.Такси Премиум":
-                    self.log("✅ Updated service successfully")
-                else:
-                    self.log("❌ Service update data mismatch", "ERROR")
-                    all_passed = False
-            else:
-                self.log(f"❌ Failed to update service: {response.status_code}", "ERROR")
-                all_passed = False
-                
-        except Exception as e:
-            self.log(f"❌ Error updating service: {str(e)}", "ERROR")
+        ok, updated_service = await self._req("PUT", f"/services/{service_id}", json=SERVICE_UPDATE_BODY)
+        if not ok:
+            self.log(f"❌ Failed to update service: {updated_service}", "ERROR")
+            all_passed = False
+        elif updated_service["name"] == SERVICE_UPDATE_BODY["name"]:
+            self.log("✅ Updated service successfully")
+        else:
+            self.log("❌ Service update data mismatch", "ERROR")
             all_passed = False
         
         return all_passed
     
-    def test_phones_crud(self) -> bool:
+    async def test_phones_crud(self) -> bool:
         """Test CRUD operations for phones"""
         self.log("\n=== Testing Phones CRUD ===")
         
@@ -309,101 +253,56 @@ class UPNAPITester:
         operator_id = self.created_ids['operators'][0]
         
         # Test CREATE phone
-        try:
-            phone_data = {
-                "number": "+79651091162",  # Will be normalized
-                "operator_id": operator_id
-            }
-            
-            response = self.session.post(
-                f"{self.base_url}/phones",
-                json=phone_data
-            )
-            
-            if response.status_code == 200:
-                phone = response.json()
-                phone_id = phone["_id"]  # Use _id instead of id
-                self.created_ids['phones'].append(phone_id)
-                self.log(f"✅ Created phone: {phone['number']} (ID: {phone_id})")
-                
-                # Verify normalization
-                if phone["number"] == "+7 965 109 11 62":
-                    self.log("✅ Phone number normalized correctly")
-                else:
-                    self.log(f"❌ Phone normalization failed: {phone['number']}", "ERROR")
-                    all_passed = False
-            else:
-                self.log(f"❌ Failed to create phone: {response.status_code} - {response.text}", "ERROR")
-                all_passed = False
-                return all_passed
-                
-        except Exception as e:
-            self.log(f"❌ Error creating phone: {str(e)}", "ERROR")
+        phone_data = {
+            "number": "+79651091162",  # Will be normalized
+            "operator_id": operator_id
+        }
+        
+        ok, phone = await self._req("POST", "/phones", json=phone_data)
+        if not ok:
+            self.log(f"❌ Failed to create phone: {phone}", "ERROR")
+            return False
+        
+        phone_id = phone["_id"]  # Use _id instead of id
+        self.created_ids['phones'].append(phone_id)
+        self.log(f"✅ Created phone: {phone['number']} (ID: {phone_id})")
+        
+        # Verify normalization
+        if phone["number"] == "+7 965 109 11 62":
+            self.log("✅ Phone number normalized correctly")
+        else:
+            self.log(f"❌ Phone normalization failed: {phone['number']}", "ERROR")
             all_passed = False
-            return all_passed
         
         # Test duplicate phone creation (should fail)
-        try:
-            duplicate_phone_data = {
-                "number": "89651091162",  # Same number, different format
-                "operator_id": operator_id
-            }
-            
-            response = self.session.post(
-                f"{self.base_url}/phones",
-                json=duplicate_phone_data
-            )
-            
-            if response.status_code == 409:
-                self.log("✅ Correctly rejected duplicate phone number")
-            else:
-                self.log(f"❌ Should have rejected duplicate phone: {response.status_code}", "ERROR")
-                all_passed = False
-                
-        except Exception as e:
-            self.log(f"❌ Error testing duplicate phone: {str(e)}", "ERROR")
-            all_passed = False
+        duplicate_phone_data = {
+            "number": "89651091162",  # Same number, different format
+            "operator_id": operator_id
+        }
         
-        # Test GET all phones
-        try:
-            response = self.session.get(f"{self.base_url}/phones")
-            
-            if response.status_code == 200:
-                phones = response.json()
-                self.log(f"✅ Retrieved {len(phones)} phones")
-            else:
-                self.log(f"❌ Failed to get phones: {response.status_code}", "ERROR")
-                all_passed = False
-                
-        except Exception as e:
-            self.log(f"❌ Error getting phones: {str(e)}", "ERROR")
+        ok, error = await self._req("POST", "/phones", expect=409, read_body=False, json=duplicate_phone_data)
+        if ok:
+            self.log("✅ Correctly rejected duplicate phone number")
+        else:
+            self.log(f"❌ Should have rejected duplicate phone: {error}", "ERROR")
             all_passed = False
         
         # Test invalid operator ID
-        try:
-            invalid_phone_data = {
-                "number": "+79651091163",
-                "operator_id": "invalid_id"
-            }
-            
-            response = self.session.post(
-                f"{self.base_url}/phones",
-                json=invalid_phone_data
-            )
-            
-            if response.status_code == 400:
-                self.log("✅ Correctly rejected invalid operator ID")
-            else:
-                self.log(f"❌ Should have rejected invalid operator ID: {response.status_code}", "ERROR")
-                all_passed = False
-                
-        except Exception as e:
-            self.log(f"❌ Error testing invalid operator ID: {str(e)}", "ERROR")
+        invalid_phone_data = {
+            "number": "+79651091163",
+            "operator_id": "invalid_id"
+        }
+        
+        ok, error = await self._req("POST", "/phones", expect=400, read_body=False, json=invalid_phone_data)
+        if ok:
+            self.log("✅ Correctly rejected invalid operator ID")
+        else:
+            self.log(f"❌ Should have rejected invalid operator ID: {error}", "ERROR")
             all_passed = False
         
         return all_passed
     
-    def test_usage_tracking(self) -> bool:
+    async def test_usage_tracking(self) -> bool:
         """Test usage tracking functionality"""
         self.log("\n=== Testing Usage Tracking ===")
         
@@ -414,145 +313,183 @@ class UPNAPITester:
             self.log("❌ No phones or services available for usage testing", "ERROR")
             return False
         
-        phone_id = self.created_ids['phones'][0]
-        service_id = self.created_ids['services'][0]
+        usage_data = {
+            "phone_id": self.created_ids['phones'][0],
+            "service_id": self.created_ids['services'][0]
+        }
         
         # Test CREATE usage
-        try:
-            usage_data = {
-                "phone_id": phone_id,
-                "service_id": service_id
-            }
-            
-            response = self.session.post(
-                f"{self.base_url}/usage",
-                json=usage_data
-            )
-            
-            if response.status_code == 200:
-                usage = response.json()
-                usage_id = usage["_id"]  # Use _id instead of id
-                self.created_ids['usage'].append(usage_id)
-                self.log(f"✅ Created usage record (ID: {usage_id})")
+        ok, usage = await self._req("POST", "/usage", json=usage_data)
+        if not ok:
+            self.log(f"❌ Failed to create usage: {usage}", "ERROR")
+            return False
+        
+        usage_id = usage["_id"]  # Use _id instead of id
+        self.created_ids['usage'].append(usage_id)
+        self.log(f"✅ Created usage record (ID: {usage_id})")
+        
+        # Test duplicate usage (should fail)
+        ok, error = await self._req("POST", "/usage", expect=409, read_body=False, json=usage_data)
+        if ok:
+            self.log("✅ Correctly rejected duplicate usage")
+        else:
+            self.log(f"❌ Should have rejected duplicate usage: {error}", "ERROR")
+            all_passed = False
+        
+        return all_passed
+    
+    async def test_list_endpoints(self) -> bool:
+        """Test the list endpoints and fetch every created object by ID"""
+        self.log("\n=== Testing List Endpoints ===")
+        
+        all_passed = True
+        
+        collections = ["operators", "services", "phones", "usage"]
+        responses = await asyncio.gather(
+            *(self._req("GET", f"/{collection}") for collection in collections)
+        )
+        
+        # The shared database keeps growing, so created objects need not be on
+        # the first page; they are checked by ID below instead
+        for collection, (ok, records) in zip(collections, responses):
+            if ok:
+                self.log(f"✅ Retrieved {len(records)} {collection}")
             else:
-                self.log(f"❌ Failed to create usage: {response.status_code} - {response.text}", "ERROR")
+                self.log(f"❌ Failed to get {collection}: {records}", "ERROR")
                 all_passed = False
-                return all_passed
-                
-        except Exception as e:
-            self.log(f"❌ Error creating usage: {str(e)}", "ERROR")
-            all_passed = False
-            return all_passed
         
-        # Test duplicate usage (should fail)
-        try:
-            duplicate_usage_data = {
-                "phone_id": phone_id,
-                "service_id": service_id
-            }
-            
-            response = self.session.post(
-                f"{self.base_url}/usage",
-                json=duplicate_usage_data
-            )
-            
-            if response.status_code == 409:
-                self.log("✅ Correctly rejected duplicate usage")
+        # Usage records have no single-item endpoint
+        lookups = [
+            (collection, object_id)
+            for collection in ("operators", "services", "phones")
+            for object_id in self.created_ids[collection]
+        ]
+        outcomes = await asyncio.gather(
+            *(self._req("GET", f"/{collection}/{object_id}") for collection, object_id in lookups)
+        )
+        
+        for (collection, object_id), (ok, record) in zip(lookups, outcomes):
+            if not ok:
+                self.log(f"❌ Failed to get {collection} {object_id}: {record}", "ERROR")
+                all_passed = False
+            elif record["_id"] == object_id:
+                self.log(f"✅ Retrieved {collection} {object_id} by ID")
             else:
-                self.log(f"❌ Should have rejected duplicate usage: {response.status_code}", "ERROR")
+                self.log(f"❌ {collection} {object_id} returned {record['_id']}", "ERROR")
                 all_passed = False
-                
-        except Exception as e:
-            self.log(f"❌ Error testing duplicate usage: {str(e)}", "ERROR")
+        
+        # Paging: two one-record pages in _id order, and out-of-range limits
+        (first_ok, first_page), (second_ok, second_page), (zero_ok, zero_error), (over_ok, over_error) = await asyncio.gather(
+            self._req("GET", "/operators", params={"limit": 1, "skip": 0}),
+            self._req("GET", "/operators", params={"limit": 1, "skip": 1}),
+            self._req("GET", "/operators", expect=422, read_body=False, params={"limit": 0}),
+            self._req("GET", "/operators", expect=422, read_body=False, params={"limit": 1001})
+        )
+        
+        if not (first_ok and second_ok):
+            self.log(f"❌ Failed to page operators: {first_page if not first_ok else second_page}", "ERROR")
+            all_passed = False
+        elif len(first_page) != 1 or len(second_page) > 1:
+            self.log(f"❌ limit=1 returned {len(first_page)} and {len(second_page)} operators", "ERROR")
+            all_passed = False
+        elif not second_page:
+            self.log("⚠️  Only one operator stored, cannot compare pages", "WARNING")
+        elif first_page[0]["_id"] < second_page[0]["_id"]:
+            # ObjectId hex strings have a fixed width, so they compare in _id order
+            self.log("✅ Operator pages are distinct and in ascending _id order")
+        else:
+            self.log(f"❌ Pages out of order: {first_page[0]['_id']} then {second_page[0]['_id']}", "ERROR")
             all_passed = False
         
-        # Test GET all usage
-        try:
-            response = self.session.get(f"{self.base_url}/usage")
-            
-            if response.status_code == 200:
-                usage_records = response.json()
-                self.log(f"✅ Retrieved {len(usage_records)} usage records")
+        for limit, ok, error in [(0, zero_ok, zero_error), (1001, over_ok, over_error)]:
+            if ok:
+                self.log(f"✅ Correctly rejected limit={limit}")
             else:
-                self.log(f"❌ Failed to get usage records: {response.status_code}", "ERROR")
+                self.log(f"❌ Should have returned 422 for limit={limit}: {error}", "ERROR")
                 all_passed = False
-                
-        except Exception as e:
-            self.log(f"❌ Error getting usage records: {str(e)}", "ERROR")
+        
+        # include_logos=false must drop logo_base64 from every record
+        ok, light_operators = await self._req("GET", "/operators", params={"include_logos": "false"})
+        if not ok:
+            self.log(f"❌ Failed to get operators without logos: {light_operators}", "ERROR")
+            return False
+        
+        if any("logo_base64" in op for op in light_operators):
+            self.log("❌ include_logos=false still returned logo_base64", "ERROR")
             all_passed = False
+        else:
+            self.log(f"✅ include_logos=false omitted logos from {len(light_operators)} operators")
+        
+        # The default call must still carry the created operator's logo; fetch
+        # just its position in the page rather than every logo again
+        operator_id = self.created_ids['operators'][0] if self.created_ids['operators'] else None
+        position = next((i for i, op in enumerate(light_operators) if op["_id"] == operator_id), None)
+        if position is None:
+            self.log("⚠️  Created operator not on the first page, cannot check its logo", "WARNING")
+        else:
+            ok, page = await self._req("GET", "/operators", params={"skip": position, "limit": 1})
+            if not ok:
+                self.log(f"❌ Failed to get operator with logo: {page}", "ERROR")
+                all_passed = False
+            elif page and page[0]["_id"] == operator_id and page[0].get("logo_base64") == SAMPLE_LOGO_B64:
+                self.log("✅ Default operator list still returns logos")
+            else:
+                self.log("❌ Default operator list is missing the created operator's logo", "ERROR")
+                all_passed = False
         
         return all_passed
     
-    def test_search_functionality(self) -> bool:
+    async def test_search_functionality(self) -> bool:
         """Test search functionality"""
         self.log("\n=== Testing Search Functionality ===")
         
         all_passed = True
         
+        # The three searches share no state, so issue them concurrently
+        (phone_ok, phone_results), (service_ok, service_results), (full_ok, full_results) = await asyncio.gather(
+            self._req("GET", "/search", params={"q": "965"}),
+            self._req("GET", "/search", params={"q": "Яндекс"}),
+            self._req("GET", "/search", params={"q": "+79651091162"})
+        )
+        
         # Test search by phone number
-        try:
-            response = self.session.get(f"{self.base_url}/search?q=965")
+        if phone_ok:
+            self.log(f"✅ Search by phone partial returned {len(phone_results)} results")
             
-            if response.status_code == 200:
-                results = response.json()
-                self.log(f"✅ Search by phone partial returned {len(results)} results")
-                
-                # Check if we have phone results
-                phone_results = [r for r in results if r["type"] == "phone"]
-                if phone_results:
-                    self.log("✅ Found phone in search results")
-                else:
-                    self.log("❌ No phone found in search results", "ERROR")
-                    all_passed = False
+            # Check if we have phone results
+            if any(r["type"] == "phone" for r in phone_results):
+                self.log("✅ Found phone in search results")
             else:
-                self.log(f"❌ Failed to search by phone: {response.status_code}", "ERROR")
+                self.log("❌ No phone found in search results", "ERROR")
                 all_passed = False
-                
-        except Exception as e:
-            self.log(f"❌ Error searching by phone: {str(e)}", "ERROR")
+        else:
+            self.log(f"❌ Failed to search by phone: {phone_results}", "ERROR")
             all_passed = False
         
         # Test search by service name
-        try:
-            response = self.session.get(f"{self.base_url}/search?q=Яндекс")
+        if service_ok:
+            self.log(f"✅ Search by service name returned {len(service_results)} results")
             
-            if response.status_code == 200:
-                results = response.json()
-                self.log(f"✅ Search by service name returned {len(results)} results")
-                
-                # Check if we have service results
-                service_results = [r for r in results if r["type"] == "service"]
-                if service_results:
-                    self.log("✅ Found service in search results")
-                else:
-                    self.log("❌ No service found in search results", "ERROR")
-                    all_passed = False
+            # Check if we have service results
+            if any(r["type"] == "service" for r in service_results):
+                self.log("✅ Found service in search results")
             else:
-                self.log(f"❌ Failed to search by service: {response.status_code}", "ERROR")
+                self.log("❌ No service found in search results", "ERROR")
                 all_passed = False
-                
-        except Exception as e:
-            self.log(f"❌ Error searching by service: {str(e)}", "ERROR")
+        else:
+            self.log(f"❌ Failed to search by service: {service_results}", "ERROR")
             all_passed = False
         
         # Test search with normalized phone number
-        try:
-            response = self.session.get(f"{self.base_url}/search?q=+79651091162")
-            
-            if response.status_code == 200:
-                results = response.json()
-                self.log(f"✅ Search by full phone number returned {len(results)} results")
-            else:
-                self.log(f"❌ Failed to search by full phone: {response.status_code}", "ERROR")
-                all_passed = False
-                
-        except Exception as e:
-            self.log(f"❌ Error searching by full phone: {str(e)}", "ERROR")
+        if full_ok:
+            self.log(f"✅ Search by full phone number returned {len(full_results)} results")
+        else:
+            self.log(f"❌ Failed to search by full phone: {full_results}", "ERROR")
             all_passed = False
         
         return all_passed
     
-    def test_error_handling(self) -> bool:
+    async def test_error_handling(self) -> bool:
         """Test error handling scenarios"""
         self.log("\n=== Testing Error Handling ===")
         
@@ -561,116 +498,93 @@ class UPNAPITester:
         # Test invalid IDs
         invalid_id = "invalid_object_id"
         
-        endpoints_to_test = [
-            f"/operators/{invalid_id}",
-            f"/services/{invalid_id}",
-            f"/phones/{invalid_id}"
-        ]
+        # Valid ObjectId format but doesn't exist
+        non_existent_id = "507f1f77bcf86cd799439011"
         
-        for endpoint in endpoints_to_test:
-            try:
-                response = self.session.get(f"{self.base_url}{endpoint}")
-                
-                if response.status_code == 400:
-                    self.log(f"✅ Correctly handled invalid ID for {endpoint}")
-                else:
-                    self.log(f"❌ Should have returned 400 for invalid ID {endpoint}: {response.status_code}", "ERROR")
-                    all_passed = False
-                    
-            except Exception as e:
-                self.log(f"❌ Error testing invalid ID for {endpoint}: {str(e)}", "ERROR")
-                all_passed = False
+        # (endpoint, expected status, description) - all independent, so one batch
+        calls = [
+            (f"/{collection}/{invalid_id}", 400, "invalid ID")
+            for collection in ("operators", "services", "phones")
+        ] + [
+            (f"/{collection}/{non_existent_id}", 404, "non-existent ID")
+            for collection in ("operators", "services", "phones")
+        ]
         
-        # Test non-existent IDs
-        non_existent_id = "507f1f77bcf86cd799439011"  # Valid ObjectId format but doesn't exist
+        outcomes = await asyncio.gather(
+            *(self._req("GET", endpoint, expect=status, read_body=False) for endpoint, status, _ in calls)
+        )
         
-        for endpoint in endpoints_to_test:
-            endpoint_with_valid_id = endpoint.replace(invalid_id, non_existent_id)
-            try:
-                response = self.session.get(f"{self.base_url}{endpoint_with_valid_id}")
-                
-                if response.status_code == 404:
-                    self.log(f"✅ Correctly handled non-existent ID for {endpoint_with_valid_id}")
-                else:
-                    self.log(f"❌ Should have returned 404 for non-existent ID {endpoint_with_valid_id}: {response.status_code}", "ERROR")
-                    all_passed = False
-                    
-            except Exception as e:
-                self.log(f"❌ Error testing non-existent ID for {endpoint_with_valid_id}: {str(e)}", "ERROR")
+        for (endpoint, expected_status, description), (ok, error) in zip(calls, outcomes):
+            if ok:
+                self.log(f"✅ Correctly handled {description} for {endpoint}")
+            else:
+                self.log(f"❌ Should have returned {expected_status} for {description} {endpoint}: {error}", "ERROR")
                 all_passed = False
         
         return all_passed
     
-    def cleanup(self):
+    async def _delete(self, collection: str, label: str, object_id: str):
+        """Delete one created object, logging the outcome"""
+        ok, error = await self._req("DELETE", f"/{collection}/{object_id}", read_body=False)
+        if ok:
+            self.log(f"✅ Deleted {label} {object_id}")
+        else:
+            self.log(f"❌ Failed to delete {label} {object_id}: {error}", "ERROR")
+    
+    async def cleanup(self):
         """Clean up created test data"""
         self.log("\n=== Cleaning Up Test Data ===")
         
-        # Delete in reverse order to handle dependencies
-        for usage_id in self.created_ids['usage']:
-            try:
-                response = self.session.delete(f"{self.base_url}/usage/{usage_id}")
-                if response.status_code == 200:
-                    self.log(f"✅ Deleted usage {usage_id}")
-                else:
-                    self.log(f"❌ Failed to delete usage {usage_id}: {response.status_code}", "ERROR")
-            except Exception as e:
-                self.log(f"❌ Error deleting usage {usage_id}: {str(e)}", "ERROR")
-        
-        for phone_id in self.created_ids['phones']:
-            try:
-                response = self.session.delete(f"{self.base_url}/phones/{phone_id}")
-                if response.status_code == 200:
-                    self.log(f"✅ Deleted phone {phone_id}")
-                else:
-                    self.log(f"❌ Failed to delete phone {phone_id}: {response.status_code}", "ERROR")
-            except Exception as e:
-                self.log(f"❌ Error deleting phone {phone_id}: {str(e)}", "ERROR")
-        
-        for service_id in self.created_ids['services']:
-            try:
-                response = self.session.delete(f"{self.base_url}/services/{service_id}")
-                if response.status_code == 200:
-                    self.log(f"✅ Deleted service {service_id}")
-                else:
-                    self.log(f"❌ Failed to delete service {service_id}: {response.status_code}", "ERROR")
-            except Exception as e:
-                self.log(f"❌ Error deleting service {service_id}: {str(e)}", "ERROR")
-        
-        for operator_id in self.created_ids['operators']:
-            try:
-                response = self.session.delete(f"{self.base_url}/operators/{operator_id}")
-                if response.status_code == 200:
-                    self.log(f"✅ Deleted operator {operator_id}")
-                else:
-                    self.log(f"❌ Failed to delete operator {operator_id}: {response.status_code}", "ERROR")
-            except Exception as e:
-                self.log(f"❌ Error deleting operator {operator_id}: {str(e)}", "ERROR")
+        # Delete in reverse order to handle dependencies; objects of the same
+        # kind are independent, so each level is deleted concurrently
+        for collection, label in [
+            ("usage", "usage"),
+            ("phones", "phone"),
+            ("services", "service"),
+            ("operators", "operator")
+        ]:
+            await asyncio.gather(*(
+                self._delete(collection, label, object_id)
+                for object_id in self.created_ids[collection]
+            ))
     
-    def run_all_tests(self) -> Dict[str, bool]:
+    async def run_all_tests(self) -> Dict[str, bool]:
         """Run all tests and return results"""
         self.log("🚀 Starting UPN Backend API Tests")
         self.log(f"Backend URL: {self.base_url}")
         
         results = {}
         
-        # Test connection first
-        if not self.test_connection():
-            self.log("❌ Cannot proceed without API connection", "ERROR")
-            return {"connection": False}
-        
-        results["connection"] = True
-        
-        # Run all test suites
-        results["phone_normalization"] = self.test_phone_normalization()
-        results["operators_crud"] = self.test_operators_crud()
-        results["services_crud"] = self.test_services_crud()
-        results["phones_crud"] = self.test_phones_crud()
-        results["usage_tracking"] = self.test_usage_tracking()
-        results["search_functionality"] = self.test_search_functionality()
-        results["error_handling"] = self.test_error_handling()
-        
-        # Clean up
-        self.cleanup()
+        async with self.client:
+            # Test connection first
+            if not await self.test_connection():
+                self.log("❌ Cannot proceed without API connection", "ERROR")
+                return {"connection": False}
+            
+            results["connection"] = True
+            
+            # Run all test suites (each depends on data created by the previous ones)
+            suites = [
+                ("phone_normalization", self.test_phone_normalization),
+                ("operators_crud", self.test_operators_crud),
+                ("services_crud", self.test_services_crud),
+                ("phones_crud", self.test_phones_crud),
+                ("usage_tracking", self.test_usage_tracking),
+                ("list_endpoints", self.test_list_endpoints),
+                ("search_functionality", self.test_search_functionality),
+                ("error_handling", self.test_error_handling)
+            ]
+            for name, suite in suites:
+                await self._warm_up()
+                try:
+                    results[name] = await suite()
+                except Exception as e:
+                    # e.g. a response missing an expected field
+                    self.log(f"❌ Error in {name}: {str(e)}", "ERROR")
+                    results[name] = False
+            
+            # Clean up
+            await self.cleanup()
         
         # Summary
         self.log("\n" + "="*50)
@@ -698,7 +612,7 @@ class UPNAPITester:
 def main():
     """Main test runner"""
     tester = UPNAPITester()
-    results = tester.run_all_tests()
+    results = asyncio.run(tester.run_all_tests())
     
     # Exit with error code if any tests failed
     if not all(results.values()):
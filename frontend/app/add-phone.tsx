@@ -43,7 +43,7 @@ export default function AddPhoneScreen() {
   const loadOperators = async () => {
     setIsLoadingOperators(true);
     try {
-      const response = await fetch(`${BACKEND_URL}/api/operators`);
+      const response = await fetch(`${BACKEND_URL}/api/operators?include_logos=false`);
       if (response.ok) {
         const operatorsData = await response.json();
         setOperators(operatorsData);
@@ -71,7 +71,7 @@ export default function EditPhoneScreen() {
 
   const loadOperators = async () => {
     try {
-      const response = await fetch(`${BACKEND_URL}/api/operators`);
+      const response = await fetch(`${BACKEND_URL}/api/operators?include_logos=false`);
       if (response.ok) {
         const operatorsData = await response.json();
         setOperators(operatorsData);
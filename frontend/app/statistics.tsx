@@ -40,8 +40,8 @@ export default function StatisticsScreen() {
     try {
       // Fetch all data for statistics
       const [operatorsRes, servicesRes, phonesRes, usageRes] = await Promise.all([
-        fetch(`${BACKEND_URL}/api/operators`),
-        fetch(`${BACKEND_URL}/api/services`),
+        fetch(`${BACKEND_URL}/api/operators?include_logos=false`),
+        fetch(`${BACKEND_URL}/api/services?include_logos=false`),
         fetch(`${BACKEND_URL}/api/phones`),
         fetch(`${BACKEND_URL}/api/usage`),
       ]);